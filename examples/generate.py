@@ -10,6 +10,7 @@
 Usage:
     python examples/generate.py --num-samples 100
     python examples/generate.py --num-samples 100 --output data/my_task --seed 42
+    python examples/generate.py --num-samples 1000 --workers 8
 """
 
 import argparse
@@ -56,6 +57,12 @@ Examples:
         action="store_true",
         help="Disable video generation"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, sequential)"
+    )
     
     args = parser.parse_args()
     
@@ -75,7 +82,11 @@ Examples:
     
     # Generate tasks
     generator = TaskGenerator(config)
-    tasks = generator.generate_dataset()
+    if args.workers > 1:
+        task_ids = [f"{config.domain}_{i:04d}" for i in range(config.num_samples)]
+        tasks = generator.generate_batch(task_ids, max_workers=args.workers)
+    else:
+        tasks = generator.generate_dataset()
     
     # Write to disk
     writer = OutputWriter(Path(args.output))
@@ -4,6 +4,7 @@ Collision Physics Task implementation.
 Files:
     - config.py   : Task-specific configuration (TaskConfig)
     - generator.py: Collision physics generation logic (CollisionPhysicsGenerator)
+    - _kernels.py : Simulation kernels, optionally Numba-compiled
     - prompts.py  : Task prompts/instructions (get_prompt)
 """
 
@@ -0,0 +1,153 @@
+"""
+Numeric kernels for the collision simulation.
+
+Written against the subset of NumPy that Numba can compile. They run as plain
+NumPy by default; set COLLISION_PHYSICS_NUMBA=1 (with numba installed) to
+JIT-compile them instead, with identical results. At this task's ~30-frame
+size the JIT is not faster, so it is opt-in.
+"""
+
+import importlib.util
+import os
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+NUMBA_ENABLED = NUMBA_AVAILABLE and os.environ.get("COLLISION_PHYSICS_NUMBA") == "1"
+
+# Columns of a (num_steps, 4) trajectory array
+POS_A, POS_B, VEL_A, VEL_B = range(4)
+
+if NUMBA_ENABLED:
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def collision_response(pos_a, pos_b, vel_a, vel_b, mass_a, mass_b, radius_a, radius_b,
+                       restitution):
+    """Return (contact time or inf, velocity of A after, velocity of B after)."""
+    # Time of contact (no collision if not approaching or already overlapping)
+    gap = pos_b - pos_a - radius_a - radius_b
+    closing_speed = vel_a - vel_b
+    if closing_speed > 0 and gap >= 0:
+        t_c = gap / closing_speed
+    else:
+        t_c = np.inf
+
+    # 1D collision response
+    momentum = mass_a * vel_a + mass_b * vel_b
+    total_mass = mass_a + mass_b
+    new_vel_a = (momentum + mass_b * restitution * (vel_b - vel_a)) / total_mass
+    new_vel_b = (momentum + mass_a * restitution * (vel_a - vel_b)) / total_mass
+    return t_c, new_vel_a, new_vel_b
+
+
+@njit(cache=True)
+def simulate_1d(pos_a, pos_b, vel_a, vel_b, mass_a, mass_b, radius_a, radius_b,
+                restitution, t, out):
+    """
+    Fill the (len(t), 4) trajectory array out of a two-ball 1D collision.
+
+    Both balls move at constant velocity until contact (if they are
+    approaching and not already overlapping), exchange momentum once with the
+    given coefficient of restitution, then move at constant velocity again.
+    """
+    t_c, new_vel_a, new_vel_b = collision_response(
+        pos_a, pos_b, vel_a, vel_b, mass_a, mass_b, radius_a, radius_b, restitution)
+
+    t_before = np.minimum(t, t_c)
+    t_after = np.maximum(t - t_c, 0.0)
+    before = t < t_c
+
+    out[:, POS_A] = pos_a + vel_a * t_before + new_vel_a * t_after
+    out[:, POS_B] = pos_b + vel_b * t_before + new_vel_b * t_after
+    out[:, VEL_A] = np.where(before, vel_a, new_vel_a)
+    out[:, VEL_B] = np.where(before, vel_b, new_vel_b)
+
+
+@njit(cache=True)
+def final_frame_index(trajectories, margin_a, margin_b,
+                      world_width, separation_threshold):
+    """
+    Pick the frame of a trajectory array for the final state image.
+
+    First frame at or after the collision (minimum center distance) where
+    both balls are in frame and at least separation_threshold apart; else
+    the last frame after the collision with both balls in frame; else ten
+    frames after the collision.
+    """
+    positions_a = trajectories[:, POS_A]
+    positions_b = trajectories[:, POS_B]
+    num_frames = len(trajectories)
+
+    # Find when collision happens (minimum distance between ball centers)
+    distances = np.abs(positions_b - positions_a)
+    collision_idx = int(distances.argmin())
+
+    # Check if both balls are in frame
+    in_frame = ((positions_a >= margin_a) & (positions_a <= world_width - margin_a) &
+                (positions_b >= margin_b) & (positions_b <= world_width - margin_b))
+
+    good = in_frame & (distances >= separation_threshold)
+    good[:collision_idx] = False
+    if good.any():
+        return int(good.argmax())
+
+    # Fallback: use last frame where both balls are visible
+    visible_after = in_frame[collision_idx + 1:]
+    if visible_after.any():
+        return num_frames - 1 - int(visible_after[::-1].argmax())
+
+    # Last resort: use frame right after collision
+    return min(collision_idx + 10, num_frames - 1)
+
+
+@njit(cache=True)
+def final_frame_index_1d(pos_a, pos_b, vel_a, vel_b, mass_a, mass_b, radius_a, radius_b,
+                         restitution, dt, num_frames, margin_a, margin_b,
+                         world_width, separation_threshold):
+    """
+    Closed-form shortcut for final_frame_index that never samples the trajectory.
+
+    Covers the usual case: the balls collide within the sampled frames, are
+    closer than separation_threshold in the frame nearest contact, and are
+    both still in frame once they are separation_threshold apart again.
+    Returns the same frame as final_frame_index there, and -1 otherwise so
+    the caller can fall back to the sampled search.
+    """
+    t_c, new_vel_a, new_vel_b = collision_response(
+        pos_a, pos_b, vel_a, vel_b, mass_a, mass_b, radius_a, radius_b, restitution)
+    contact_distance = radius_a + radius_b
+    separation_speed = new_vel_b - new_vel_a
+    if not t_c <= (num_frames - 1) * dt or separation_speed <= 0:
+        return -1
+
+    # Frame nearest contact (distance shrinks until t_c, then grows)
+    before = int(np.floor(t_c / dt))
+    collision_distance = contact_distance + (vel_a - vel_b) * (t_c - before * dt)
+    if before + 1 < num_frames:
+        after_distance = contact_distance + separation_speed * ((before + 1) * dt - t_c)
+        collision_distance = min(collision_distance, after_distance)
+    if collision_distance >= separation_threshold:
+        return -1
+
+    # First frame at which the balls are well separated again
+    t_sep = t_c + (separation_threshold - contact_distance) / separation_speed
+    idx = int(np.ceil(t_sep / dt))
+    if idx >= num_frames:
+        return -1
+
+    # Check if both balls are in frame
+    t_after = idx * dt - t_c
+    final_pos_a = pos_a + vel_a * t_c + new_vel_a * t_after
+    final_pos_b = pos_b + vel_b * t_c + new_vel_b * t_after
+    if not (margin_a <= final_pos_a <= world_width - margin_a and
+            margin_b <= final_pos_b <= world_width - margin_b):
+        return -1
+
+    return idx
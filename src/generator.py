@@ -2,22 +2,58 @@
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                     COLLISION PHYSICS TASK GENERATOR                          ║
 ║                                                                               ║
-║  Generates elastic collision physics tasks using pymunk physics engine.        ║
+║  Generates elastic collision physics tasks using closed-form 1D dynamics.      ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
+import os
+import queue
 import random
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import pymunk
 
 from core import BaseGenerator, TaskPair, ImageRenderer
 from core.video_utils import VideoGenerator
+from ._kernels import (
+    POS_A, POS_B, VEL_A, VEL_B, final_frame_index, final_frame_index_1d, simulate_1d
+)
 from .config import TaskConfig
 from .prompts import get_prompt
 
 
+FONT_PATHS = [
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "Arial.ttf",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_font_path() -> Optional[str]:
+    """Return the first loadable font path, probing the filesystem only once."""
+    for font_path in FONT_PATHS:
+        try:
+            ImageFont.truetype(font_path, 10)
+            return font_path
+        except (OSError, IOError):
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    """Load (and cache) the task font at the given size."""
+    font_path = _resolve_font_path()
+    if font_path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_path, size)
+
+
 class CollisionPhysicsGenerator(BaseGenerator):
     """
     Collision Physics Task Generator.
@@ -27,6 +63,7 @@ class CollisionPhysicsGenerator(BaseGenerator):
 
     def __init__(self, config: TaskConfig):
         super().__init__(config)
+        self._rng = np.random.default_rng(config.random_seed)
         self.renderer = ImageRenderer(image_size=config.image_size)
 
         # Initialize video generator if enabled
@@ -40,23 +77,97 @@ class CollisionPhysicsGenerator(BaseGenerator):
         self.arrow_color = (60, 180, 60)  # Green for velocity arrows
         self.text_color = (40, 40, 40)
 
+        # Map world coordinates to image coordinates
+        # Assume world is 14m wide, centered in image
+        world_width = 14.0  # meters
+        self._pixels_per_world_meter = config.image_size[0] / world_width
+
+        # Boolean ball masks keyed by radius (see _ball_masks)
+        self._ball_mask_cache = {}
+
+        # Label (width, height) keyed by (text, font size) (see _text_size)
+        self._text_metrics = {}
+
+        # Background video encoding (see _generate_video)
+        self._encoder = None
+
+        # Frame sample times are identical for every task, so build them once
+        dt = 1.0 / config.video_fps  # Time step per frame
+        num_steps = int(config.simulation_duration * config.video_fps)
+        self._frame_times = np.arange(num_steps) * dt
+
     def generate_task_pair(self, task_id: str) -> TaskPair:
-        """Generate one collision physics task."""
+        """Generate one collision physics task (waits for its video to be written)."""
+        pair, video_future = self._generate_task_pair_async(task_id)
+        if video_future is not None:
+            pair.ground_truth_video = video_future.result()
+        return pair
+
+    def generate_dataset(self) -> List[TaskPair]:
+        """
+        Generate complete dataset.
+
+        Videos are encoded in the background while the next tasks are
+        rendered; all of them are written before this returns.
+        """
+        pairs = []
+        video_futures = []
+        for i in range(self.config.num_samples):
+            task_id = f"{self.config.domain}_{i:04d}"
+            pair, video_future = self._generate_task_pair_async(task_id)
+            pairs.append(pair)
+            video_futures.append(video_future)
+            print(f"  Generated: {task_id}")
+
+        for pair, video_future in zip(pairs, video_futures):
+            if video_future is not None:
+                pair.ground_truth_video = video_future.result()
+        return pairs
+
+    def _generate_task_pair_async(self, task_id: str) -> tuple:
+        """
+        Generate one task, leaving its video encoding in the background.
+
+        Returns (task pair without ground_truth_video, Future of the video
+        path or None); the caller sets ground_truth_video from the future.
+        """
+        # Seed from (random_seed, task_id) so the task does not depend on
+        # which tasks were generated before it (sequentially or in workers)
+        self._seed_task(task_id)
 
         # Generate random collision scenario
         collision_data = self._generate_collision_scenario()
 
-        # Run physics simulation to get trajectories
-        trajectories = self._simulate_collision(collision_data)
+        # The first and final images are frames 0 and final_frame_idx of the
+        # animation, where final_frame_idx is the best frame for final state:
+        # After collision, when balls are separated but both still visible
+        video_future = None
+        if self.config.generate_videos and self.video_generator:
+            # Run physics simulation to get trajectories, then render the
+            # animation once and keep the two frames as it is encoded
+            trajectories = self._simulate_collision(collision_data)
+            final_frame_idx = self._find_final_frame_index(collision_data, trajectories)
+            video_future, stills = self._generate_video(collision_data, trajectories, task_id,
+                                                        (0, final_frame_idx))
+            first_frame, final_frame = stills[0], stills[final_frame_idx]
+            final_state = trajectories[final_frame_idx]
+        else:
+            # Stills only: solve for the final frame directly and evaluate
+            # just the two frames instead of the whole trajectory
+            final_frame_idx = self._final_frame_index_analytic(collision_data)
+            if final_frame_idx is not None:
+                states = self._simulate_collision(collision_data, (0, final_frame_idx))
+            else:
+                trajectories = self._simulate_collision(collision_data)
+                final_frame_idx = self._find_final_frame_index(collision_data, trajectories)
+                states = trajectories[[0, final_frame_idx]]
+            first_frame, final_frame = (frame.copy() for frame in
+                                        self._iter_animation_frames(collision_data, states))
+            final_state = states[1]
 
         # Render first and final frames
-        first_image = self._render_initial_state(collision_data)
-        final_image = self._render_final_state(collision_data, trajectories)
-
-        # Generate video if enabled
-        video_path = None
-        if self.config.generate_videos and self.video_generator:
-            video_path = self._generate_video(collision_data, trajectories, task_id)
+        first_image = self._render_initial_state(collision_data, first_frame)
+        final_image = self._render_final_state(collision_data, final_state, final_frame)
 
         # Get prompt with specific parameters
         prompt = get_prompt(
@@ -67,31 +178,65 @@ class CollisionPhysicsGenerator(BaseGenerator):
             self.config.collision_type
         )
 
-        return TaskPair(
+        pair = TaskPair(
             task_id=task_id,
             domain=self.config.domain,
             prompt=prompt,
             first_image=first_image,
             final_image=final_image,
-            ground_truth_video=video_path
         )
+        return pair, video_future
+
+    def generate_batch(self, task_ids: List[str], max_workers: Optional[int] = None) -> List[TaskPair]:
+        """
+        Generate several tasks in parallel worker processes.
+
+        Each task is seeded from (random_seed, task_id), as in
+        generate_dataset, so a seeded batch produces the same tasks as a
+        sequential run regardless of worker count or scheduling order.
+
+        Args:
+            task_ids: IDs of the tasks to generate
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            Task pairs in the same order as task_ids
+        """
+        pairs = []
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                 initializer=_init_worker,
+                                 initargs=(self.config,)) as executor:
+            for pair in executor.map(_generate_in_worker, task_ids, chunksize=4):
+                pairs.append(pair)
+                print(f"  Generated: {pair.task_id}")
+        return pairs
 
     # ══════════════════════════════════════════════════════════════════════════
     #  PHYSICS SIMULATION
     # ══════════════════════════════════════════════════════════════════════════
 
+    def _seed_task(self, task_id: str):
+        """Reseed the RNGs from (random_seed, task_id) so a task is reproducible on its own."""
+        if self.config.random_seed is None:
+            return
+        task_key = f"{self.config.random_seed}:{task_id}"
+        random.seed(task_key)
+        self._rng = np.random.default_rng(int.from_bytes(task_key.encode(), "little"))
+
     def _generate_collision_scenario(self) -> dict:
         """Generate random collision parameters."""
 
-        # Random masses
-        mass_a = random.uniform(self.config.min_mass, self.config.max_mass)
-        mass_b = random.uniform(self.config.min_mass, self.config.max_mass)
+        # Random masses and speeds, drawn in a single call
+        mass_a, mass_b, speed_a, speed_b = self._rng.uniform(
+            [self.config.min_mass, self.config.min_mass, self.config.min_velocity, self.config.min_velocity],
+            [self.config.max_mass, self.config.max_mass, self.config.max_velocity, self.config.max_velocity],
+        )
 
-        # Random velocities (ensure they will collide)
+        # Velocities (ensure they will collide)
         # Ball A starts on left, Ball B starts on right
         # Ball A moves right (positive), Ball B moves left (negative) to ensure collision
-        velocity_a = random.uniform(self.config.min_velocity, self.config.max_velocity)
-        velocity_b = -random.uniform(self.config.min_velocity, self.config.max_velocity)
+        velocity_a = speed_a
+        velocity_b = -speed_b
 
         # Calculate ball radii based on mass (visual indication)
         radius_a = self._mass_to_radius(mass_a)
@@ -127,78 +272,53 @@ class CollisionPhysicsGenerator(BaseGenerator):
 
         return int(radius)
 
-    def _simulate_collision(self, scenario: dict) -> dict:
-        """
-        Simulate collision using pymunk physics engine.
+    def _collision_args(self, scenario: dict) -> tuple:
+        """Scenario parameters (SI units) in the order the _kernels functions take them."""
+        # Coefficient of restitution (pymunk multiplies the two shapes' 0.5
+        # elasticities, so the historical inelastic setting is 0.25)
+        restitution = 1.0 if self.config.collision_type == "elastic" else 0.25
+
+        return (
+            float(scenario["pos_a"]), float(scenario["pos_b"]),
+            float(scenario["velocity_a"]), float(scenario["velocity_b"]),
+            float(scenario["mass_a"]), float(scenario["mass_b"]),
+            scenario["radius_a"] / self.config.pixels_per_meter,
+            scenario["radius_b"] / self.config.pixels_per_meter,
+            restitution,
+        )
 
-        Returns trajectories (positions and velocities over time).
+    def _simulate_collision(self, scenario: dict,
+                            frame_indices: Optional[Sequence[int]] = None) -> np.ndarray:
         """
-        # Create pymunk space
-        space = pymunk.Space()
-        space.gravity = (0, 0)  # No gravity (1D horizontal collision)
-
-        # Create balls as pymunk bodies
-        # Ball A
-        moment_a = pymunk.moment_for_circle(scenario["mass_a"], 0, scenario["radius_a"] / self.config.pixels_per_meter)
-        body_a = pymunk.Body(scenario["mass_a"], moment_a)
-        body_a.position = (scenario["pos_a"], 0)
-        body_a.velocity = (scenario["velocity_a"], 0)
-        shape_a = pymunk.Circle(body_a, scenario["radius_a"] / self.config.pixels_per_meter)
-        shape_a.elasticity = 1.0 if self.config.collision_type == "elastic" else 0.5
-        shape_a.friction = 0.0
-        space.add(body_a, shape_a)
-
-        # Ball B
-        moment_b = pymunk.moment_for_circle(scenario["mass_b"], 0, scenario["radius_b"] / self.config.pixels_per_meter)
-        body_b = pymunk.Body(scenario["mass_b"], moment_b)
-        body_b.position = (scenario["pos_b"], 0)
-        body_b.velocity = (scenario["velocity_b"], 0)
-        shape_b = pymunk.Circle(body_b, scenario["radius_b"] / self.config.pixels_per_meter)
-        shape_b.elasticity = 1.0 if self.config.collision_type == "elastic" else 0.5
-        shape_b.friction = 0.0
-        space.add(body_b, shape_b)
-
-        # Run simulation
-        dt = 1.0 / self.config.video_fps  # Time step per frame
-        num_steps = int(self.config.simulation_duration * self.config.video_fps)
-
-        trajectories = {
-            "positions_a": [],
-            "positions_b": [],
-            "velocities_a": [],
-            "velocities_b": [],
-        }
+        Simulate the 1D collision in closed form (see _kernels.simulate_1d).
 
-        for _ in range(num_steps):
-            space.step(dt)
-            trajectories["positions_a"].append(body_a.position[0])
-            trajectories["positions_b"].append(body_b.position[0])
-            trajectories["velocities_a"].append(body_a.velocity[0])
-            trajectories["velocities_b"].append(body_b.velocity[0])
+        Returns trajectories as one (num_steps, 4) float32 array with columns
+        POS_A, POS_B, VEL_A, VEL_B (positions and velocities over time), or
+        only the rows for frame_indices if given.
+        """
+        t = self._frame_times
+        if frame_indices is not None:
+            t = t[list(frame_indices)]
 
+        trajectories = np.empty((len(t), 4), dtype=np.float32)
+        simulate_1d(*self._collision_args(scenario), t, trajectories)
         return trajectories
 
     # ══════════════════════════════════════════════════════════════════════════
     #  RENDERING
     # ══════════════════════════════════════════════════════════════════════════
 
-    def _render_initial_state(self, scenario: dict) -> Image.Image:
-        """Render initial state with velocity arrows."""
-        img = Image.new("RGB", self.config.image_size, self.bg_color)
+    def _render_initial_state(self, scenario: dict, frame: np.ndarray) -> Image.Image:
+        """Render initial state (animation frame 0) with velocity arrows."""
+        img = Image.fromarray(frame)
         draw = ImageDraw.Draw(img)
 
         # Get positions in pixels
         width, height = self.config.image_size
         center_y = height // 2
 
-        x_a = self._meters_to_pixels(scenario["pos_a"])
-        x_b = self._meters_to_pixels(scenario["pos_b"])
-
-        # Draw balls
-        self._draw_ball(draw, x_a, center_y, scenario["radius_a"],
-                       self.ball_colors[0], scenario["mass_a"])
-        self._draw_ball(draw, x_b, center_y, scenario["radius_b"],
-                       self.ball_colors[1], scenario["mass_b"])
+        x_a = round(self._meters_to_pixels(scenario["pos_a"]))
+        x_b = round(self._meters_to_pixels(scenario["pos_b"]))
 
         # Draw velocity arrows
         if self.config.show_velocity_arrows:
@@ -209,32 +329,23 @@ class CollisionPhysicsGenerator(BaseGenerator):
 
         return img
 
-    def _render_final_state(self, scenario: dict, trajectories: dict) -> Image.Image:
-        """Render final state after collision (when balls are separated but still visible)."""
-        img = Image.new("RGB", self.config.image_size, self.bg_color)
+    def _render_final_state(self, scenario: dict, final_state: np.ndarray,
+                            frame: np.ndarray) -> Image.Image:
+        """Render final state (its animation frame and trajectory row) with velocity arrows."""
+        img = Image.fromarray(frame)
         draw = ImageDraw.Draw(img)
 
-        # Find the best frame for final state:
-        # After collision, when balls are separated but both still visible
-        final_frame_idx = self._find_final_frame_index(scenario, trajectories)
-
         # Get positions at that frame
         width, height = self.config.image_size
         center_y = height // 2
 
-        final_x_a = self._meters_to_pixels(trajectories["positions_a"][final_frame_idx])
-        final_x_b = self._meters_to_pixels(trajectories["positions_b"][final_frame_idx])
-
-        # Draw balls
-        self._draw_ball(draw, final_x_a, center_y, scenario["radius_a"],
-                       self.ball_colors[0], scenario["mass_a"])
-        self._draw_ball(draw, final_x_b, center_y, scenario["radius_b"],
-                       self.ball_colors[1], scenario["mass_b"])
+        final_x_a = round(self._meters_to_pixels(final_state[POS_A]))
+        final_x_b = round(self._meters_to_pixels(final_state[POS_B]))
 
         # Optionally draw final velocity arrows
         if self.config.show_velocity_arrows:
-            final_vel_a = trajectories["velocities_a"][final_frame_idx]
-            final_vel_b = trajectories["velocities_b"][final_frame_idx]
+            final_vel_a = final_state[VEL_A]
+            final_vel_b = final_state[VEL_B]
             self._draw_velocity_arrow(draw, final_x_a, center_y, final_vel_a,
                                      scenario["radius_a"])
             self._draw_velocity_arrow(draw, final_x_b, center_y, final_vel_b,
@@ -242,7 +353,7 @@ class CollisionPhysicsGenerator(BaseGenerator):
 
         return img
 
-    def _find_final_frame_index(self, scenario: dict, trajectories: dict) -> int:
+    def _find_final_frame_index(self, scenario: dict, trajectories: np.ndarray) -> int:
         """
         Find the best frame for the final state image.
 
@@ -253,79 +364,94 @@ class CollisionPhysicsGenerator(BaseGenerator):
 
         Returns the frame index to use for the final state.
         """
-        positions_a = trajectories["positions_a"]
-        positions_b = trajectories["positions_b"]
-
-        # World boundaries (with margin for ball radius)
-        world_width = 14.0
-        radius_margin_a = (scenario["radius_a"] / self.config.pixels_per_meter)
-        radius_margin_b = (scenario["radius_b"] / self.config.pixels_per_meter)
-
-        # Find when collision happens (minimum distance between ball centers)
-        distances = [abs(positions_b[i] - positions_a[i]) for i in range(len(positions_a))]
-        collision_idx = distances.index(min(distances))
-
-        # After collision, find a good frame where:
-        # - Balls are separated by at least 2m (well separated)
-        # - Both balls are still in frame
-        separation_threshold = 2.0  # meters
-
-        for i in range(collision_idx, len(positions_a)):
-            pos_a = positions_a[i]
-            pos_b = positions_b[i]
-
-            # Check if both balls are in frame
-            in_frame_a = (radius_margin_a <= pos_a <= world_width - radius_margin_a)
-            in_frame_b = (radius_margin_b <= pos_b <= world_width - radius_margin_b)
-
-            # Check if separated enough
-            distance = abs(pos_b - pos_a)
-            well_separated = distance >= separation_threshold
-
-            if in_frame_a and in_frame_b and well_separated:
-                return i
-
-        # Fallback: use last frame where both balls are visible
-        for i in range(len(positions_a) - 1, collision_idx, -1):
-            pos_a = positions_a[i]
-            pos_b = positions_b[i]
+        # World boundaries (with margin for ball radius); balls should be
+        # separated by at least 2m (well separated)
+        return final_frame_index(
+            trajectories,
+            scenario["radius_a"] / self.config.pixels_per_meter,
+            scenario["radius_b"] / self.config.pixels_per_meter,
+            14.0,
+            2.0,
+        )
 
-            in_frame_a = (radius_margin_a <= pos_a <= world_width - radius_margin_a)
-            in_frame_b = (radius_margin_b <= pos_b <= world_width - radius_margin_b)
+    def _final_frame_index_analytic(self, scenario: dict) -> Optional[int]:
+        """
+        Same frame as _find_final_frame_index, solved without sampling the
+        trajectory (see _kernels.final_frame_index_1d).
 
-            if in_frame_a and in_frame_b:
-                return i
+        Returns None when the closed-form shortcut does not apply.
+        """
+        idx = final_frame_index_1d(
+            *self._collision_args(scenario),
+            1.0 / self.config.video_fps,
+            len(self._frame_times),
+            scenario["radius_a"] / self.config.pixels_per_meter,
+            scenario["radius_b"] / self.config.pixels_per_meter,
+            14.0,
+            2.0,
+        )
+        return idx if idx >= 0 else None
+
+    def _ball_masks(self, radius: int) -> tuple:
+        """Get the (cached) boolean fill and outline masks for a ball radius."""
+        masks = self._ball_mask_cache.get(radius)
+        if masks is None:
+            yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+            dist_sq = xx ** 2 + yy ** 2
+            disc = dist_sq <= radius ** 2
+            outline = disc & (dist_sq > (radius - 2) ** 2)
+            masks = self._ball_mask_cache[radius] = (disc, outline)
+        return masks
+
+    def _ball_region(self, frame: np.ndarray, x: int, y: int, radius: int) -> tuple:
+        """
+        Clip a ball's bounding box to the frame.
 
-        # Last resort: use frame right after collision
-        return min(collision_idx + 10, len(positions_a) - 1)
+        Returns the frame view covered by the ball and the matching slices
+        into its (2r+1, 2r+1) masks, or (None, None) if it is fully outside.
+        """
+        height, width = frame.shape[:2]
+        x0, y0 = x - radius, y - radius
+        size = 2 * radius + 1
+        left, top = max(x0, 0), max(y0, 0)
+        right, bottom = min(x0 + size, width), min(y0 + size, height)
+        if right <= left or bottom <= top:
+            return None, None
+
+        window = (slice(top - y0, bottom - y0), slice(left - x0, right - x0))
+        return frame[top:bottom, left:right], window
+
+    def _draw_ball_np(self, frame: np.ndarray, x: int, y: int, radius: int, color: tuple):
+        """Draw a filled, outlined ball into an RGB frame array."""
+        region, window = self._ball_region(frame, x, y, radius)
+        if region is None:
+            return
 
-    def _draw_ball(self, draw: ImageDraw.Draw, x: float, y: float,
-                   radius: float, color: tuple, mass: float):
-        """Draw a ball with optional mass label."""
-        # Draw circle
-        draw.ellipse([x - radius, y - radius, x + radius, y + radius],
-                    fill=color, outline=(0, 0, 0), width=2)
+        disc, outline = self._ball_masks(radius)
+        region[disc[window]] = color
+        region[outline[window]] = (0, 0, 0)
 
-        # Draw mass label
+    def _draw_mass_label(self, draw: ImageDraw.Draw, x: float, y: float,
+                         radius: float, mass: float):
+        """Draw the optional mass label centered on a ball."""
         if self.config.show_mass_labels:
-            font = self._get_font(int(radius * 0.5))
+            font_size = int(radius * 0.5)
             text = f"{mass:.1f}kg"
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            text_width, text_height = self._text_size(text, font_size)
             text_x = x - text_width // 2
             text_y = y - text_height // 2
-            draw.text((text_x, text_y), text, fill=(255, 255, 255), font=font)
+            draw.text((text_x, text_y), text, fill=(255, 255, 255), font=self._get_font(font_size))
 
     def _draw_velocity_arrow(self, draw: ImageDraw.Draw, x: float, y: float,
                             velocity: float, radius: float):
-        """Draw a velocity arrow."""
+        """Draw a velocity arrow (stills only; animation frames have no arrows)."""
         # Arrow length proportional to velocity
         arrow_scale = 10  # pixels per m/s
         arrow_length = velocity * arrow_scale
 
-        # Arrow starts from edge of ball
-        start_x = x + radius if velocity > 0 else x - radius
+        # Arrow points right (+1) or left (-1) and starts from edge of ball
+        direction = 1 if velocity > 0 else -1
+        start_x = x + direction * radius
         end_x = start_x + arrow_length
 
         # Don't draw if velocity is too small
@@ -335,93 +461,189 @@ class CollisionPhysicsGenerator(BaseGenerator):
         # Draw arrow line
         draw.line([start_x, y, end_x, y], fill=self.arrow_color, width=3)
 
-        # Draw arrowhead
+        # Draw arrowhead (base sits behind the tip, opposite to the direction)
         arrow_size = 8
-        if velocity > 0:  # Right arrow
-            draw.polygon([
-                (end_x, y),
-                (end_x - arrow_size, y - arrow_size // 2),
-                (end_x - arrow_size, y + arrow_size // 2)
-            ], fill=self.arrow_color)
-        else:  # Left arrow
-            draw.polygon([
-                (end_x, y),
-                (end_x + arrow_size, y - arrow_size // 2),
-                (end_x + arrow_size, y + arrow_size // 2)
-            ], fill=self.arrow_color)
+        base_x = end_x - direction * arrow_size
+        draw.polygon([
+            (end_x, y),
+            (base_x, y - arrow_size // 2),
+            (base_x, y + arrow_size // 2)
+        ], fill=self.arrow_color)
 
         # Draw velocity label
-        font = self._get_font(14)
         vel_text = f"{abs(velocity):.1f}m/s"
         label_y = y - 25
-        bbox = draw.textbbox((0, 0), vel_text, font=font)
-        text_width = bbox[2] - bbox[0]
+        text_width, _ = self._text_size(vel_text, 14)
         label_x = (start_x + end_x) / 2 - text_width / 2
-        draw.text((label_x, label_y), vel_text, fill=self.arrow_color, font=font)
+        draw.text((label_x, label_y), vel_text, fill=self.arrow_color, font=self._get_font(14))
 
-    def _meters_to_pixels(self, meters: float) -> float:
-        """Convert meters to pixel coordinates."""
-        # Map world coordinates to image coordinates
-        # Assume world is 14m wide, centered in image
-        width = self.config.image_size[0]
-        world_width = 14.0  # meters
-        return (meters / world_width) * width
+    def _meters_to_pixels(self, meters):
+        """Convert meters (a float or an array) to pixel coordinates."""
+        return meters * self._pixels_per_world_meter
 
     def _get_font(self, size: int) -> ImageFont.FreeTypeFont:
         """Get a font for text rendering."""
-        font_paths = [
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "Arial.ttf",
-        ]
-
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except (OSError, IOError):
-                continue
+        return _load_font(size)
 
-        return ImageFont.load_default()
+    def _text_size(self, text: str, size: int) -> tuple:
+        """Get the (cached) pixel width and height of a label at a font size."""
+        key = (text, size)
+        metrics = self._text_metrics.get(key)
+        if metrics is None:
+            left, top, right, bottom = self._get_font(size).getbbox(text)
+            metrics = self._text_metrics[key] = (right - left, bottom - top)
+        return metrics
 
     # ══════════════════════════════════════════════════════════════════════════
     #  VIDEO GENERATION
     # ══════════════════════════════════════════════════════════════════════════
 
-    def _generate_video(self, scenario: dict, trajectories: dict, task_id: str) -> str:
-        """Generate ground truth video showing collision."""
+    def _generate_video(self, scenario: dict, trajectories: np.ndarray, task_id: str,
+                        keep_indices: Sequence[int] = ()) -> tuple:
+        """
+        Generate ground truth video showing collision.
+
+        Frames are rendered on the calling thread and handed to a background
+        encoder through a small bounded queue, so encoding overlaps with
+        rendering and the caller can move on to the next task while the last
+        queued frames are written.
+
+        Returns (Future of the video path or None, {index: frame copy} for keep_indices).
+        """
         temp_dir = Path(tempfile.gettempdir()) / f"{self.config.domain}_videos"
         temp_dir.mkdir(parents=True, exist_ok=True)
         video_path = temp_dir / f"{task_id}_ground_truth.mp4"
 
-        # Create animation frames
-        frames = self._create_animation_frames(scenario, trajectories)
-
-        result = self.video_generator.create_video_from_frames(frames, video_path)
+        if self._encoder is None:
+            self._encoder = ThreadPoolExecutor(max_workers=2)
+
+        frame_queue = queue.Queue(maxsize=8)
+        video_future = self._encoder.submit(self._encode_queued_frames, frame_queue, video_path)
+
+        kept = {}
+        try:
+            for i, frame in enumerate(self._iter_animation_frames(scenario, trajectories)):
+                if i in keep_indices:
+                    kept[i] = frame.copy()
+                # The frame buffer is reused, so the encoder gets its own copy,
+                # made in the encoder's BGR channel order in the same pass
+                frame_queue.put(frame[:, :, ::-1].copy())
+        finally:
+            frame_queue.put(None)
+
+        return video_future, kept
+
+    def _encode_queued_frames(self, frame_queue: queue.Queue, output_path: Path) -> Optional[str]:
+        """Encode frames from a queue until a None sentinel (runs on the encoder thread)."""
+        finished = False
+
+        def frames():
+            nonlocal finished
+            while (frame := frame_queue.get()) is not None:
+                yield frame
+            finished = True
+
+        try:
+            result = self._write_video_stream(frames(), output_path)
+        finally:
+            # Drain on error so the producer never blocks on a full queue
+            while not finished:
+                finished = frame_queue.get() is None
         return str(result) if result else None
 
-    def _create_animation_frames(self, scenario: dict, trajectories: dict) -> list:
-        """Create animation frames showing the collision."""
-        frames = []
+    def _write_video_stream(self, frames: Iterator[np.ndarray], output_path: Path) -> Optional[Path]:
+        """
+        Encode BGR uint8 frame arrays as they are produced.
+
+        Same output as VideoGenerator.create_video_from_frames, but consumes
+        an iterator so only one frame is held in memory at a time.
+        """
+        import cv2  # Only reached when VideoGenerator is available
+
+        output_path = Path(output_path).with_suffix(self.video_generator.extension)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        writer = cv2.VideoWriter(
+            str(output_path),
+            cv2.VideoWriter_fourcc(*self.video_generator.codec),
+            self.video_generator.fps,
+            self.config.image_size
+        )
+
+        num_written = 0
+        for frame in frames:
+            writer.write(frame)
+            num_written += 1
+
+        writer.release()
+        return output_path if num_written else None
+
+    def _iter_animation_frames(self, scenario: dict, trajectories: np.ndarray) -> Iterator[np.ndarray]:
+        """
+        Yield animation frames showing the collision.
+
+        Every frame is the same reused (height, width, 3) RGB buffer, so it is
+        only valid until the next frame is requested; copy it to keep it.
+        """
         width, height = self.config.image_size
         center_y = height // 2
 
-        num_frames = len(trajectories["positions_a"])
+        # Ball appearance is constant across frames, so render each ball once
+        # and only blit it into a single reused frame buffer
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        sprite_a = self._render_ball_sprite(scenario["radius_a"], self.ball_colors[0], scenario["mass_a"])
+        sprite_b = self._render_ball_sprite(scenario["radius_b"], self.ball_colors[1], scenario["mass_b"])
 
-        for i in range(num_frames):
-            # Create frame
-            img = Image.new("RGB", self.config.image_size, self.bg_color)
-            draw = ImageDraw.Draw(img)
+        # Pixel x positions of both balls for every frame, converted at once
+        pixel_x = np.rint(self._meters_to_pixels(trajectories[:, [POS_A, POS_B]])).astype(int).tolist()
 
-            # Get positions for this frame
-            x_a = self._meters_to_pixels(trajectories["positions_a"][i])
-            x_b = self._meters_to_pixels(trajectories["positions_b"][i])
+        for x_a, x_b in pixel_x:
+            # Clear frame
+            frame[:] = self.bg_color
 
             # Draw balls
-            self._draw_ball(draw, x_a, center_y, scenario["radius_a"],
-                           self.ball_colors[0], scenario["mass_a"])
-            self._draw_ball(draw, x_b, center_y, scenario["radius_b"],
-                           self.ball_colors[1], scenario["mass_b"])
+            self._blit_ball_sprite(frame, x_a, center_y, scenario["radius_a"], sprite_a)
+            self._blit_ball_sprite(frame, x_b, center_y, scenario["radius_b"], sprite_b)
+
+            yield frame
+
+    def _render_ball_sprite(self, radius: int, color: tuple, mass: float) -> np.ndarray:
+        """Render a ball (with its mass label) once into a (2r+1, 2r+1) RGB array."""
+        size = 2 * radius + 1
+        sprite = np.zeros((size, size, 3), dtype=np.uint8)
+        self._draw_ball_np(sprite, radius, radius, radius, color)
+
+        img = Image.fromarray(sprite)
+        self._draw_mass_label(ImageDraw.Draw(img), radius, radius, radius, mass)
+        return np.asarray(img)
+
+    def _blit_ball_sprite(self, frame: np.ndarray, x: int, y: int, radius: int, sprite: np.ndarray):
+        """Copy a ball sprite into a frame array through its disc mask."""
+        region, window = self._ball_region(frame, x, y, radius)
+        if region is None:
+            return
+
+        mask = self._ball_masks(radius)[0][window]
+        region[mask] = sprite[window][mask]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PARALLEL WORKERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Generator owned by the current worker process (built once by _init_worker)
+_worker_generator: Optional[CollisionPhysicsGenerator] = None
+
+
+def _init_worker(config: TaskConfig):
+    """Build this worker's generator (renderer, video writer) once."""
+    global _worker_generator
+    _worker_generator = CollisionPhysicsGenerator(config)
+    if config.random_seed is None:
+        # Forked workers inherit identical RNG state; reseed from OS entropy
+        random.seed()
 
-            frames.append(img)
 
-        return frames
+def _generate_in_worker(task_id: str) -> TaskPair:
+    """Generate one task in a worker process."""
+    return _worker_generator.generate_task_pair(task_id)
@@ -9,6 +9,18 @@
 import random
 
 
+# Prompt templates (formatted with str.format by get_prompt)
+TEMPLATES = (
+    "Two balls collide {collision_type}ally. Ball A (mass {mass_a:.1f}kg) moves {dir_a} at {abs_vel_a:.1f} m/s. Ball B (mass {mass_b:.1f}kg) moves {dir_b} at {abs_vel_b:.1f} m/s. Predict the collision outcome.",
+
+    "Ball A ({mass_a:.1f}kg, {abs_vel_a:.1f} m/s {dir_a}) and Ball B ({mass_b:.1f}kg, {abs_vel_b:.1f} m/s {dir_b}) undergo an {collision_type} collision. Show the final velocities after impact.",
+
+    "In an {collision_type} collision, Ball A (mass={mass_a:.1f}kg, velocity={velocity_a:.1f} m/s) collides with Ball B (mass={mass_b:.1f}kg, velocity={velocity_b:.1f} m/s). Animate the collision and resulting motion.",
+
+    "Predict the result of an {collision_type} collision between two balls: Ball A ({mass_a:.1f}kg) traveling {dir_a} at {abs_vel_a:.1f} m/s, and Ball B ({mass_b:.1f}kg) traveling {dir_b} at {abs_vel_b:.1f} m/s.",
+)
+
+
 def get_prompt(mass_a: float, velocity_a: float, mass_b: float, velocity_b: float,
                collision_type: str = "elastic") -> str:
     """
@@ -28,22 +40,19 @@ def get_prompt(mass_a: float, velocity_a: float, mass_b: float, velocity_b: floa
     dir_a = "right" if velocity_a > 0 else "left"
     dir_b = "right" if velocity_b > 0 else "left"
 
-    # Absolute velocities for display
-    abs_vel_a = abs(velocity_a)
-    abs_vel_b = abs(velocity_b)
-
-    # Choose a random template
-    templates = [
-        f"Two balls collide {collision_type}ally. Ball A (mass {mass_a:.1f}kg) moves {dir_a} at {abs_vel_a:.1f} m/s. Ball B (mass {mass_b:.1f}kg) moves {dir_b} at {abs_vel_b:.1f} m/s. Predict the collision outcome.",
-
-        f"Ball A ({mass_a:.1f}kg, {abs_vel_a:.1f} m/s {dir_a}) and Ball B ({mass_b:.1f}kg, {abs_vel_b:.1f} m/s {dir_b}) undergo an {collision_type} collision. Show the final velocities after impact.",
-
-        f"In an {collision_type} collision, Ball A (mass={mass_a:.1f}kg, velocity={velocity_a:.1f} m/s) collides with Ball B (mass={mass_b:.1f}kg, velocity={velocity_b:.1f} m/s). Animate the collision and resulting motion.",
-
-        f"Predict the result of an {collision_type} collision between two balls: Ball A ({mass_a:.1f}kg) traveling {dir_a} at {abs_vel_a:.1f} m/s, and Ball B ({mass_b:.1f}kg) traveling {dir_b} at {abs_vel_b:.1f} m/s.",
-    ]
-
-    return random.choice(templates)
+    # Choose a random template, then format only that one
+    template = random.choice(TEMPLATES)
+    return template.format(
+        collision_type=collision_type,
+        mass_a=mass_a,
+        mass_b=mass_b,
+        velocity_a=velocity_a,
+        velocity_b=velocity_b,
+        abs_vel_a=abs(velocity_a),
+        abs_vel_b=abs(velocity_b),
+        dir_a=dir_a,
+        dir_b=dir_b,
+    )
 
 
 def get_simple_prompt() -> str: